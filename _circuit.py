@@ -0,0 +1,130 @@
+"""
+Parameterized quantum teleportation circuit, built once at import time
+
+Only Alice's rotation angle changes between runs, so the circuit is built
+with a symbolic θ and each run just binds a value into it.
+
+The circuit shape is fixed, so the private step functions append
+pre-built instructions through QuantumCircuit._append, skipping argument
+validation and broadcasting. The instructions are bound to QREG and CREG,
+so the steps are only called from _build on a circuit built from those
+registers. The template is built once per process, so this only trims a
+one-time import cost.
+"""
+
+from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister
+from qiskit.circuit import CircuitInstruction, Measure, Parameter
+from qiskit.circuit.library import CXGate, CZGate, HGate, RYGate
+
+THETA = Parameter('θ')
+
+QREG = QuantumRegister(3, 'q')  # 3 qubits: Alice's qubit, Bell pair
+CREG = ClassicalRegister(3, 'c')  # 3 classical bits for measurements
+_Q0, _Q1, _Q2 = QREG
+_C0, _C1, _C2 = CREG
+
+_H_Q0 = CircuitInstruction(HGate(), (_Q0,))
+_H_Q1 = CircuitInstruction(HGate(), (_Q1,))
+_CX_Q0_Q1 = CircuitInstruction(CXGate(), (_Q0, _Q1))
+_CX_Q1_Q2 = CircuitInstruction(CXGate(), (_Q1, _Q2))
+_CZ_Q0_Q2 = CircuitInstruction(CZGate(), (_Q0, _Q2))
+_MEASURE_Q0 = CircuitInstruction(Measure(), (_Q0,), (_C0,))
+_MEASURE_Q1 = CircuitInstruction(Measure(), (_Q1,), (_C1,))
+_MEASURE_Q2 = CircuitInstruction(Measure(), (_Q2,), (_C2,))
+
+PROTOCOL_STEPS = (
+    "Preparing Alice's qubit in arbitrary state",
+    "Creating Bell pair between qubits 1 and 2",
+    "Performing Bell measurement on qubits 0 and 1",
+    "Applying conditional corrections to Bob's qubit",
+    "Measuring Bob's qubit",
+)
+
+
+def _prepare_arbitrary_state(circuit, theta):
+    """
+    Prepare Alice's qubit (q0) in an arbitrary state using Ry rotation
+
+    Args:
+        circuit (QuantumCircuit): Circuit built on QREG and CREG
+        theta (float or Parameter): Rotation angle for the Ry gate
+    """
+    circuit._append(CircuitInstruction(RYGate(theta), (_Q0,)))  # Rotate Alice's qubit
+
+
+def _create_bell_pair(circuit):
+    """
+    Create a Bell pair |Φ+⟩ = (|00⟩ + |11⟩)/√2 between qubits 1 and 2
+    """
+    circuit._append(_H_Q1)  # Put qubit 1 in superposition
+    circuit._append(_CX_Q1_Q2)  # Entangle qubits 1 and 2
+
+
+def _bell_measurement(circuit):
+    """
+    Perform Bell measurement on Alice's qubit and her half of the Bell pair
+    """
+    # Bell measurement: CNOT followed by Hadamard, then measurement
+    circuit._append(_CX_Q0_Q1)
+    circuit._append(_H_Q0)
+
+    # Measure Alice's qubits
+    circuit._append(_MEASURE_Q0)
+    circuit._append(_MEASURE_Q1)
+
+
+def _conditional_corrections(circuit):
+    """
+    Apply corrections to Bob's qubit based on Alice's measurement results
+
+    Alice's qubits are already measured, so controlling on them is
+    equivalent to controlling on the classical bits.
+    """
+    # If Alice measured 1 on q1, apply X gate to Bob's qubit
+    circuit._append(_CX_Q1_Q2)
+
+    # If Alice measured 1 on q0, apply Z gate to Bob's qubit
+    circuit._append(_CZ_Q0_Q2)
+
+
+def _final_measurement(circuit):
+    """
+    Measure Bob's qubit to verify the teleportation
+    """
+    circuit._append(_MEASURE_Q2)
+
+
+def _build():
+    """
+    Build the teleportation circuit with a symbolic θ
+
+    No barriers are added: they are only transpiler hints and would give
+    the simulator extra instructions to walk.
+    """
+    circuit = QuantumCircuit(QREG, CREG)
+
+    _prepare_arbitrary_state(circuit, THETA)
+    _create_bell_pair(circuit)
+    _bell_measurement(circuit)
+    _conditional_corrections(circuit)
+    _final_measurement(circuit)
+    return circuit
+
+
+TEMPLATE_QC = _build()
+
+
+def bind_circuit(theta):
+    """
+    Bind a rotation angle into the teleportation circuit template
+
+    The template only uses gates AerSimulator executes natively (ry, h, cx,
+    cz, measure), so the bound circuit can be run without transpiling.
+
+    Args:
+        theta (float): Rotation angle for Alice's initial state
+
+    Returns:
+        QuantumCircuit: The teleportation circuit for this angle
+    """
+    return TEMPLATE_QC.assign_parameters({THETA: theta}, inplace=False)
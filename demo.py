@@ -1,6 +1,7 @@
+import sys
 from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
 import numpy as np
+from teleportation_utils import _bob_counts, _expected_probs, _make_simulator
 
 print("🔬 Quantum Teleportation Simulation")
 print("=" * 50)
@@ -33,22 +34,19 @@ print("\nCircuit:")
 print(qc.draw(output='text'))
 
 # Simulate
-simulator = AerSimulator()
+simulator = _make_simulator()
 job = simulator.run(qc, shots=1000)
 result = job.result()
 counts = result.get_counts()
 
 print("\nResults:")
-for outcome, count in sorted(counts.items()):
-    prob = count/1000
-    print(f"{outcome}: {count:3d} ({prob:.3f})")
+sys.stdout.write('\n'.join(f"{outcome}: {count:3d} ({count/1000:.3f})"
+                           for outcome, count in sorted(counts.items())) + '\n')
 
 # Expected vs actual
-expected_0 = np.cos(theta/2)**2
-expected_1 = np.sin(theta/2)**2
+expected_0, expected_1 = _expected_probs(theta)
 
-bob_0 = sum(count for outcome, count in counts.items() if outcome[-1] == '0')
-bob_1 = sum(count for outcome, count in counts.items() if outcome[-1] == '1')
+bob_0, bob_1 = _bob_counts(counts)
 
 print(f"\nBob's teleported state:")
 print(f"P(|0⟩) = {bob_0/1000:.3f} (expected: {expected_0:.3f})")
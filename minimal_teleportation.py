@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 
+import sys
+
 print("Starting Quantum Teleportation Demo...")
 
 try:
     from qiskit import QuantumCircuit
-    from qiskit_aer import AerSimulator
     import numpy as np
+    from teleportation_utils import _bob_counts, _expected_probs, _make_simulator
     print("✅ All imports successful")
 except ImportError as e:
     print(f"❌ Import error: {e}")
@@ -19,13 +21,11 @@ qc = QuantumCircuit(3, 3)
 theta = np.pi/3
 print(f"Step 1: Preparing Alice's state (θ = {theta:.3f})")
 qc.ry(theta, 0)
-qc.barrier()
 
 # Step 2: Create Bell pair
 print("Step 2: Creating Bell pair")
 qc.h(1)
 qc.cx(1, 2)
-qc.barrier()
 
 # Step 3: Bell measurement
 print("Step 3: Bell measurement")
@@ -33,7 +33,6 @@ qc.cx(0, 1)
 qc.h(0)
 qc.measure(0, 0)
 qc.measure(1, 1)
-qc.barrier()
 
 # Step 4: Corrections
 print("Step 4: Conditional corrections")
@@ -47,18 +46,17 @@ print(qc.draw(output='text', fold=-1))
 
 # Simulate
 print("\nRunning simulation...")
-simulator = AerSimulator()
+simulator = _make_simulator()
 job = simulator.run(qc, shots=1000)
 result = job.result()
 counts = result.get_counts()
 
 print("\nResults:")
-for outcome, count in sorted(counts.items()):
-    print(f"{outcome}: {count}")
+sys.stdout.write('\n'.join(f"{outcome}: {count}"
+                           for outcome, count in sorted(counts.items())) + '\n')
 
-# Analyze Bob's qubit (last bit)
-bob_0 = sum(count for outcome, count in counts.items() if outcome[-1] == '0')
-bob_1 = sum(count for outcome, count in counts.items() if outcome[-1] == '1')
+# Analyze Bob's qubit (c2)
+bob_0, bob_1 = _bob_counts(counts)
 total = bob_0 + bob_1
 
 print(f"\nBob's final state:")
@@ -66,8 +64,7 @@ print(f"|0⟩: {bob_0} ({bob_0/total:.3f})")
 print(f"|1⟩: {bob_1} ({bob_1/total:.3f})")
 
 # Expected probabilities
-expected_0 = np.cos(theta/2)**2
-expected_1 = np.sin(theta/2)**2
+expected_0, expected_1 = _expected_probs(theta)
 print(f"\nExpected probabilities:")
 print(f"|0⟩: {expected_0:.3f}")
 print(f"|1⟩: {expected_1:.3f}")
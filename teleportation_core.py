@@ -0,0 +1,142 @@
+"""
+Quantum teleportation simulator shared by the console and matplotlib front-ends
+"""
+
+import math
+import numpy as np
+from qiskit.quantum_info import Statevector
+from _circuit import PROTOCOL_STEPS, bind_circuit
+from teleportation_utils import _bob_counts, _expected_probs, _make_simulator
+
+
+class QuantumTeleportationSimulator:
+    """
+    A class to simulate quantum teleportation protocol
+    """
+    
+    def __init__(self, precision='single'):
+        """
+        Args:
+            precision (str): Simulator floating point precision ('single' or 'double')
+        """
+        self.simulator = _make_simulator(precision)
+        self.circuit = None
+        
+    def build_complete_circuit(self, theta=np.pi/3):
+        """
+        Build the complete quantum teleportation circuit
+        
+        The circuit is constructed once at import time with a symbolic θ
+        (see _circuit.py); building it here only binds the angle.
+        
+        Args:
+            theta (float): Rotation angle for Alice's initial state
+        """
+        print("Building Quantum Teleportation Circuit")
+        print("=" * 50)
+        
+        for step, description in enumerate(PROTOCOL_STEPS, start=1):
+            print(f"Step {step}: {description}")
+        
+        self.circuit = bind_circuit(theta)
+        
+        print("Circuit construction complete!")
+        return self.circuit
+        
+    def get_initial_state_vector(self, theta=np.pi/3):
+        """
+        Get the state vector of Alice's initial state for comparison
+        
+        Args:
+            theta (float): Rotation angle for the initial state
+            
+        Returns:
+            Statevector: The initial quantum state
+        """
+        # Ry(θ)|0⟩ has the closed form cos(θ/2)|0⟩ + sin(θ/2)|1⟩, no simulation needed
+        return Statevector([math.cos(theta/2), math.sin(theta/2)])
+        
+    def simulate_circuit(self, shots=1024):
+        """
+        Simulate the quantum teleportation circuit
+        
+        Args:
+            shots (int): Number of simulation runs
+            
+        Returns:
+            dict: Measurement results
+        """
+        print(f"\nSimulating circuit with {shots} shots...")
+        
+        # Run the simulation. The circuit only uses gates Aer executes
+        # natively, so it is run without transpiling
+        job = self.simulator.run(self.circuit, shots=shots)
+        result = job.result()
+        counts = result.get_counts()
+        
+        print("Simulation complete!")
+        return counts
+        
+    def simulate_sweep(self, thetas, shots=1024):
+        """
+        Simulate the teleportation circuit for several angles in one job
+        
+        All bound circuits are submitted together, so the job setup cost is
+        paid once for the whole sweep rather than once per angle.
+        
+        Args:
+            thetas (iterable): Rotation angles for Alice's initial state
+            shots (int): Number of simulation runs per angle
+            
+        Returns:
+            list: Measurement results for each angle, in order
+        """
+        circuits = [bind_circuit(theta) for theta in thetas]
+        if not circuits:
+            return []  # Aer's run() rejects an empty job
+        
+        print(f"\nSimulating {len(circuits)} circuits with {shots} shots each...")
+        
+        result = self.simulator.run(circuits, shots=shots).result()
+        
+        print("Simulation complete!")
+        return [result.get_counts(i) for i in range(len(circuits))]
+        
+    def analyze_results(self, counts, theta=np.pi/3):
+        """
+        Analyze the teleportation results
+        
+        Args:
+            counts (dict): Measurement results from simulation
+            theta (float): The original rotation angle
+        """
+        print("\nTeleportation Analysis")
+        print("=" * 30)
+        
+        # Calculate expected probabilities for the teleported state
+        # |ψ⟩ = cos(θ/2)|0⟩ + sin(θ/2)|1⟩
+        prob_0, prob_1 = _expected_probs(theta)
+        
+        print(f"Original state: cos({theta/2:.3f})|0⟩ + sin({theta/2:.3f})|1⟩")
+        print(f"Expected P(|0⟩) = {prob_0:.3f}")
+        print(f"Expected P(|1⟩) = {prob_1:.3f}")
+        
+        # Analyze Bob's measurement results (c2)
+        bob_0_count, bob_1_count = _bob_counts(counts)
+        total_shots = bob_0_count + bob_1_count
+                
+        measured_prob_0 = bob_0_count / total_shots
+        measured_prob_1 = bob_1_count / total_shots
+        
+        print(f"\nMeasured results for Bob's qubit:")
+        print(f"P(|0⟩) = {measured_prob_0:.3f} (expected: {prob_0:.3f})")
+        print(f"P(|1⟩) = {measured_prob_1:.3f} (expected: {prob_1:.3f})")
+        
+        # Calculate fidelity (how close the results are to expected)
+        fidelity = np.sqrt(prob_0 * measured_prob_0) + np.sqrt(prob_1 * measured_prob_1)
+        print(f"Teleportation fidelity: {fidelity:.3f}")
+        
+        if fidelity > 0.95:
+            print("✅ Teleportation successful!")
+        else:
+            print("⚠️  Teleportation may have some errors")
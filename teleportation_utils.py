@@ -0,0 +1,69 @@
+"""
+Shared helpers for the quantum teleportation scripts
+"""
+
+import math
+
+import numpy as np
+from qiskit_aer import AerSimulator
+
+
+def _make_simulator(precision='single'):
+    """
+    Create the Aer simulator, using the GPU when one is available
+
+    On the GPU all shots run in a single batched kernel. For a 3-qubit
+    circuit this only pays off when many circuits are submitted together,
+    e.g. via QuantumTeleportationSimulator.simulate_sweep; single runs are
+    dominated by launch overhead either way.
+
+    Args:
+        precision (str): Floating point precision ('single' or 'double')
+
+    Returns:
+        AerSimulator: GPU simulator if supported, otherwise the CPU simulator
+    """
+    # Aer accepts device='GPU' on any build and only fails when running
+    # ("Simulation device "GPU" is not supported"), so probe up front
+    if 'GPU' in AerSimulator().available_devices():
+        return AerSimulator(method='statevector', device='GPU',
+                            precision=precision,
+                            batched_shots_gpu=True,
+                            batched_shots_gpu_max_qubits=3)
+    return AerSimulator(precision=precision)
+
+
+def _expected_probs(theta):
+    """
+    Expected measurement probabilities for cos(θ/2)|0⟩ + sin(θ/2)|1⟩
+
+    Uses the half-angle identities cos²(θ/2) = (1 + cos θ)/2 and
+    sin²(θ/2) = (1 - cos θ)/2, so one cosine gives both values.
+
+    Args:
+        theta (float): Rotation angle of the state
+
+    Returns:
+        tuple: (P(|0⟩), P(|1⟩))
+    """
+    c = math.cos(theta)
+    return 0.5 * (1 + c), 0.5 * (1 - c)
+
+
+def _bob_counts(counts):
+    """
+    Tally Bob's measurement results from the simulation counts
+
+    Qiskit orders bitstrings little-endian (c2 c1 c0), so Bob's bit is the
+    first character of each outcome.
+
+    Args:
+        counts (dict): Measurement results from simulation
+
+    Returns:
+        tuple: (number of times Bob measured 0, number of times Bob measured 1)
+    """
+    keys = np.fromiter((k[0] == '1' for k in counts), dtype=bool, count=len(counts))
+    vals = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    bob_1 = int(vals[keys].sum())
+    return int(vals.sum()) - bob_1, bob_1